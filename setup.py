@@ -7,4 +7,5 @@ setup(
     version="0.1.0",
     packages=["voxutil"],
     package_data={"voxutil": []},
+    extras_require={"dev": ["pytest", "pytest-xdist"]},
 )
@@ -0,0 +1,27 @@
+import glob
+import os
+import pytest
+import voxutil
+
+# find all models
+MODEL_PATHS = sorted(
+    glob.glob(
+        os.path.join(os.path.dirname(__file__), "models", "**", "*.vox"),
+        recursive=True,
+    )
+)
+
+
+@pytest.fixture(scope="session", params=MODEL_PATHS, ids=os.path.basename)
+def model_path(request):
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def parsed_voxfile(model_path):
+    return voxutil.VoxFile.read(model_path)
+
+
+@pytest.fixture(scope="session")
+def model_paths():
+    return MODEL_PATHS
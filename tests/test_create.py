@@ -3,7 +3,7 @@ import os
 import voxutil
 
 
-def test_create_basic():
+def test_create_basic(tmp_path):
     voxfile = voxutil.VoxFile(
         150,
         voxutil.voxfile.MainChunk(
@@ -25,20 +25,109 @@ def test_create_basic():
         ),
     )
 
-    voxfile.write("/tmp/test_create_basic.vox")
+    voxfile.write(os.path.join(tmp_path, "test_create_basic.vox"))
 
 
-def test_create_volume():
+def test_create_volume(tmp_path):
     volume = voxutil.Volume((10, 10, 10))
     volume.set((1, 1, 1), voxutil.Color(255, 0, 0))
     voxfile = volume.to_voxfile()
-    voxfile.write("/tmp/test_create_volume.vox")
+    voxfile.write(os.path.join(tmp_path, "test_create_volume.vox"))
 
 
-def test_create_volume_palette():
+def test_create_volume_palette(tmp_path):
     volume = voxutil.Volume((10, 10, 10))
     volume.set((1, 1, 1), voxutil.Color(255, 0, 0))
     volume.set((1, 1, 2), voxutil.Color(0, 255, 0))
     volume.set((1, 1, 3), voxutil.Color(0, 0, 255))
     voxfile = volume.to_voxfile()
-    voxfile.write("/tmp/test_create_volume_palette.vox")
+    voxfile.write(os.path.join(tmp_path, "test_create_volume_palette.vox"))
+
+
+def test_volume_set_get():
+    volume = voxutil.Volume((10, 10, 10))
+    volume.set((1, 1, 1), voxutil.Color(255, 0, 0))
+    volume.set((1, 1, 2), voxutil.Color(0, 255, 0))
+    assert volume.get((1, 1, 1)) == voxutil.Color(255, 0, 0)
+    assert volume.get((1, 1, 2)) == voxutil.Color(0, 255, 0)
+    assert volume.get((2, 2, 2)) is None
+
+    volume.set((1, 1, 1), None)
+    assert volume.get((1, 1, 1)) is None
+    assert voxutil.Color(255, 0, 0) not in volume.palette.color_count_map
+
+
+def test_xyzi_chunk_voxels():
+    chunk = voxutil.voxfile.XYZIChunk([(1, 2, 3, 4), (5, 6, 7, 8)])
+    assert chunk.voxel_bytes == bytes([1, 2, 3, 4, 5, 6, 7, 8])
+    assert chunk.voxels == ((1, 2, 3, 4), (5, 6, 7, 8))
+    assert len(chunk) == 2
+
+    assert chunk.xs == bytes([1, 5])
+    assert chunk.color_indices == bytes([4, 8])
+
+    chunk = voxutil.voxfile.XYZIChunk(bytes([1, 2, 3, 4]))
+    assert list(chunk) == [(1, 2, 3, 4)]
+
+
+def test_create_volume_default_palette():
+    volume = voxutil.Volume((255, 1, 1))
+    for i, color in enumerate(voxutil.voxfile.DEFAULT_PALETTE[1:]):
+        volume.set((i, 0, 0), voxutil.Color(*color))
+    voxfile = volume.to_voxfile()
+    assert voxfile.main.palette is None
+
+    volume.set((0, 0, 0), None)
+    voxfile = volume.to_voxfile()
+    assert voxfile.main.palette is not None
+
+
+def test_palette_chunk_palette():
+    palette = [(0, 0, 0, 0)] + [(i, i, i, 255) for i in range(1, 256)]
+    chunk = voxutil.voxfile.PaletteChunk(palette)
+    assert chunk.color_bytes[:8] == bytes([1, 1, 1, 255, 2, 2, 2, 255])
+    assert chunk.palette == tuple(palette)
+
+    with pytest.raises(TypeError):
+        chunk.palette[5] = (5, 5, 5, 0)
+
+    palette[5] = (5, 5, 5, 0)
+    chunk.palette = palette
+    assert chunk.palette[5] == (5, 5, 5, 0)
+
+
+def test_xyzi_chunk_voxels_edit():
+    chunk = voxutil.voxfile.XYZIChunk([(1, 2, 3, 4)])
+    with pytest.raises(AttributeError):
+        chunk.voxels.append((5, 6, 7, 8))
+
+    assert chunk.voxels is chunk.voxels
+
+    chunk.voxels += ((5, 6, 7, 8),)
+    assert chunk.voxels == ((1, 2, 3, 4), (5, 6, 7, 8))
+
+
+def test_index_map_chunk_palette_indices():
+    chunk = voxutil.voxfile.IndexMapChunk(range(256))
+    assert chunk.palette_indices == tuple(range(256))
+
+    with pytest.raises(TypeError):
+        chunk.palette_indices[0] = 1
+
+    chunk.palette_indices = [255 - i for i in range(256)]
+    assert chunk.index_bytes[:2] == bytes([255, 254])
+
+
+def test_chunk_without_read():
+    with pytest.raises(TypeError):
+
+        class NoReadChunk(voxutil.voxfile.Chunk):
+            id = b"NONE"
+
+
+def test_chunk_subclass_dispatch():
+    class MyTransformChunk(voxutil.voxfile.TransformChunk):
+        pass
+
+    child_cls, _ = voxutil.voxfile._MAIN_CHILDREN[b"nTRN"]
+    assert child_cls is voxutil.voxfile.TransformChunk
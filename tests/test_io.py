@@ -1,30 +1,20 @@
 import pytest
 import os
+import struct
 import voxutil
 
-# find all models
-MODEL_PATHS = []
-for root, dirs, files in os.walk("tests/models"):
-    for file in files:
-        if file.endswith(".vox"):
-            MODEL_PATHS.append(os.path.join(root, file))
 
+def test_read(parsed_voxfile):
+    assert isinstance(parsed_voxfile, voxutil.VoxFile)
 
-@pytest.mark.parametrize("model_path", MODEL_PATHS)
-def test_read(model_path):
-    voxutil.VoxFile.read(model_path)
 
+def test_read_write(model_path, parsed_voxfile, tmp_path):
+    new_path = os.path.join(tmp_path, os.path.basename(model_path))
 
-@pytest.mark.parametrize("model_path", MODEL_PATHS)
-def test_read_write(model_path):
-    tmp_path = os.path.join("/tmp", os.path.basename(model_path))
-
-    vox_file = voxutil.VoxFile.read(model_path)
-
-    vox_file.write(tmp_path)
+    parsed_voxfile.write(new_path)
 
     # make sure vox file generated is identical
-    with open(model_path, "rb") as orig_file, open(tmp_path, "rb") as new_file:
+    with open(model_path, "rb") as orig_file, open(new_path, "rb") as new_file:
         orig_bytes = orig_file.read()
         new_bytes = new_file.read()
 
@@ -36,9 +26,116 @@ def test_read_write(model_path):
                 )
 
             # find first differing byte
-            index = 0
-            while True:
-                if orig_bytes[index] != new_bytes[index]:
-                    raise ValueError(f"Files differ at {hex(index)}")
+            index = next(
+                i for i, (a, b) in enumerate(zip(orig_bytes, new_bytes)) if a != b
+            )
+            raise ValueError(f"Files differ at {hex(index)}")
+
+
+def test_read_truncated(model_path, tmp_path):
+    truncated_path = os.path.join(tmp_path, os.path.basename(model_path))
+
+    with open(model_path, "rb") as orig_file, open(truncated_path, "wb") as new_file:
+        new_file.write(orig_file.read()[:-1])
+
+    with pytest.raises(ValueError):
+        voxutil.VoxFile.read(truncated_path)
+
+
+def test_read_empty(tmp_path):
+    empty_path = os.path.join(tmp_path, "empty.vox")
+    open(empty_path, "wb").close()
+
+    with pytest.raises(ValueError, match="header"):
+        voxutil.VoxFile.read(empty_path)
+
+
+def test_read_rewritten(tmp_path):
+    path = os.path.join(tmp_path, "rewritten.vox")
+
+    for size in ((1, 2, 3), (4, 5, 6)):
+        volume = voxutil.Volume(size)
+        volume.set((0, 0, 0), voxutil.Color(255, 0, 0))
+        volume.to_voxfile().write(path)
+
+        assert voxutil.VoxFile.read(path).main.models[0][0].size == size
+
+
+def test_read_unknown_chunk():
+    children = b"ABCD" + struct.pack("<ii", 3, 0) + b"xyz"
+    children += b"PACK" + struct.pack("<iii", 4, 0, 1)
+    main_bytes = b"MAIN" + struct.pack("<ii", 0, len(children)) + children
+
+    main = voxutil.voxfile.MainChunk.read(voxutil.voxfile.FileIter(main_bytes))
+    assert main.pack.num_models == 1
+
+
+def test_read_negative_size():
+    children = b"ABCD" + struct.pack("<ii", -12, 0)
+    main_bytes = b"MAIN" + struct.pack("<ii", 0, len(children)) + children
+
+    with pytest.raises(ValueError):
+        voxutil.voxfile.MainChunk.read(voxutil.voxfile.FileIter(main_bytes))
+
+
+def test_read_many(model_paths):
+    vox_files = voxutil.VoxFile.read_many(model_paths)
+
+    assert len(vox_files) == len(model_paths)
+    for model_path, vox_file in zip(model_paths, vox_files):
+        assert bytes(vox_file.main) == bytes(voxutil.VoxFile.read(model_path).main)
+
+
+def test_read_many_serial(model_path):
+    (vox_file,) = voxutil.VoxFile.read_many([model_path])
+
+    assert bytes(vox_file.main) == bytes(voxutil.VoxFile.read(model_path).main)
+
+
+def test_read_write_pack_and_note(tmp_path):
+    voxfile = voxutil.VoxFile(
+        150,
+        voxutil.voxfile.MainChunk(
+            voxutil.voxfile.PackChunk(1),
+            [
+                (
+                    voxutil.voxfile.SizeChunk((2, 2, 2)),
+                    voxutil.voxfile.XYZIChunk([(0, 1, 1, 3)]),
+                )
+            ],
+            None,
+            [],
+            [],
+            [],
+            [],
+            [],
+            voxutil.voxfile.PaletteNoteChunk(["red", "grün"]),
+            None,
+        ),
+    )
+    path = os.path.join(tmp_path, "pack_and_note.vox")
+    voxfile.write(path)
+
+    read_voxfile = voxutil.VoxFile.read(path)
+    assert read_voxfile.main.pack.num_models == 1
+    assert read_voxfile.main.palette_note.color_names == ["red", "grün"]
+
+
+def test_read_negative_string_length():
+    negative_length = (-1).to_bytes(4, "little", signed=True)
+
+    with pytest.raises(ValueError):
+        voxutil.voxfile.FileIter(negative_length).read_string()
+
+    with pytest.raises(ValueError):
+        voxutil.voxfile.FileIter(
+            (1).to_bytes(4, "little") + negative_length
+        ).read_dict()
+
+
+def test_read_negative_group_children():
+    content = struct.pack("<iii", 0, 0, -1)
+    chunk_bytes = b"nGRP" + struct.pack("<ii", len(content), 0) + content
 
-                index += 1
+    with pytest.raises(ValueError):
+        voxutil.voxfile.GroupChunk.read(voxutil.voxfile.FileIter(chunk_bytes))
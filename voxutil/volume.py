@@ -5,6 +5,7 @@ MagicaVoxel .vox files. This class is meant to be used by the user to create
 volumes that can be converted to .vox files.
 """
 
+import itertools
 from voxutil import voxfile
 from typing import Optional
 
@@ -12,6 +13,8 @@ from typing import Optional
 class Color:
     """Color class."""
 
+    __slots__ = ("r", "g", "b", "a")
+
     def __init__(self, r: int, g: int, b: int, a: int = 255):
         self.r = r
         self.g = g
@@ -29,22 +32,34 @@ class Color:
         )
 
     def __hash__(self):
-        return hash((self.r, self.g, self.b, self.a))
+        # pack into a single RGBA integer rather than hashing a tuple
+        return (self.r << 24) | (self.g << 16) | (self.b << 8) | self.a
 
 
 class Palette:
-    """Palette class."""
+    """Palette class.
+
+    Colors are assigned to palette indices [1-255]; index 0 denotes an empty
+    voxel.
+    """
 
     def __init__(self):
         self.color_count_map: dict[Color, int] = {}
+        self.color_to_index: dict[Color, int] = {}
+        self.colors: list[Optional[Color]] = [None for _ in range(256)]
+        self.free_indices = list(range(255, 0, -1))
 
-    def use_color(self, color: Color):
+    def use_color(self, color: Color) -> int:
         if color in self.color_count_map:
             self.color_count_map[color] += 1
         else:
-            if len(self.color_count_map) >= 256:
+            if not self.free_indices:
                 raise ValueError("Palette is full.")
+            index = self.free_indices.pop()
             self.color_count_map[color] = 1
+            self.color_to_index[color] = index
+            self.colors[index] = color
+        return self.color_to_index[color]
 
     def unuse_color(self, color: Color):
         if color not in self.color_count_map:
@@ -52,60 +67,70 @@ class Palette:
         self.color_count_map[color] -= 1
         if self.color_count_map[color] == 0:
             del self.color_count_map[color]
+            index = self.color_to_index.pop(color)
+            self.colors[index] = None
+            self.free_indices.append(index)
 
 
 class Volume:
-    """Volume class."""
+    """Volume class.
+
+    Voxels are stored as one palette index byte each, with 0 meaning empty.
+    """
+
+    __slots__ = ("size", "voxels", "palette", "_sx", "_sy", "_sz", "_sxy")
 
     def __init__(self, size: tuple[int, int, int]):
         self.size = size
-        self.voxels: list[Optional[Color]] = [
-            None for _ in range(size[0] * size[1] * size[2])
-        ]
+        self.voxels = bytearray(size[0] * size[1] * size[2])
         self.palette = Palette()
 
+        # cache strides for linear indexing
+        self._sx, self._sy, self._sz = size
+        self._sxy = self._sx * self._sy
+
     def set(self, index: tuple[int, int, int], color: Optional[Color]):
-        for i in range(3):
-            if index[i] < 0 or index[i] >= self.size[i]:
-                raise ValueError(
-                    f"Index {i} out of bounds: {index[i]} not in [0, {self.size[0]})"
-                )
+        x, y, z = index
+        if not (0 <= x < self._sx and 0 <= y < self._sy and 0 <= z < self._sz):
+            raise ValueError(f"Index out of bounds: {index} not in {self.size}")
 
+        color_index = 0
         if color is not None:
-            self.palette.use_color(color)
+            color_index = self.palette.use_color(color)
+
+        linear_index = x + y * self._sx + z * self._sxy
 
-        prev_color = self.get(index)
-        if prev_color is not None:
-            self.palette.unuse_color(prev_color)
+        prev_color_index = self.voxels[linear_index]
+        if prev_color_index:
+            self.palette.unuse_color(self.palette.colors[prev_color_index])
 
-        self.voxels[
-            index[0] + index[1] * self.size[0] + index[2] * self.size[0] * self.size[1]
-        ] = color
+        self.voxels[linear_index] = color_index
 
     def get(self, index) -> Optional[Color]:
-        return self.voxels[
-            index[0] + index[1] * self.size[0] + index[2] * self.size[0] * self.size[1]
+        return self.palette.colors[
+            self.voxels[index[0] + index[1] * self._sx + index[2] * self._sxy]
         ]
 
     def to_voxfile(self) -> voxfile.VoxFile:
-        color: Optional[Color]
-        color_to_index = {}
-        color_list = [(0, 0, 0, 255) for _ in range(256)]
-        for i, color in enumerate(self.palette.color_count_map.keys()):
-            color_to_index[color] = i + 1
-            color_list[i + 1] = (color.r, color.g, color.b, color.a)
-
-        xyzis = []
-        for x in range(self.size[0]):
-            for y in range(self.size[1]):
-                for z in range(self.size[2]):
-                    color = self.get((x, y, z))
-                    if color is not None:
-                        xyzis.append((x, y, z, color_to_index[color]))
+        color_list = [
+            (0, 0, 0, 255) if color is None else (color.r, color.g, color.b, color.a)
+            for color in self.palette.colors
+        ]
+
+        # only visit non-empty voxels, recovering coordinates from the index
+        xyzis = bytearray()
+        voxels = self.voxels
+        for linear_index in itertools.compress(range(len(voxels)), voxels):
+            z, rem = divmod(linear_index, self._sxy)
+            y, x = divmod(rem, self._sx)
+            xyzis += bytes((x, y, z, voxels[linear_index]))
 
         models = [(voxfile.SizeChunk(self.size), voxfile.XYZIChunk(xyzis))]
 
-        palette_chunk = voxfile.PaletteChunk(color_list)
+        # MagicaVoxel falls back to its default palette if none is given
+        palette_chunk = None
+        if color_list[1:] != voxfile.DEFAULT_PALETTE[1:]:
+            palette_chunk = voxfile.PaletteChunk(color_list)
 
         return voxfile.VoxFile(
             150,
@@ -6,69 +6,241 @@ or modify .vox files, but rather to provide a way to read and write .vox files
 in a way that provides a more Pythonic interface than the raw .vox file format.
 """
 
-import io
-from typing import Optional, Union, Iterator
+import concurrent.futures
+import itertools
+import mmap
+import os
+import struct
+import sys
+from typing import Optional, Union, Iterable, Iterator, Sequence
+
+_I32 = struct.Struct("<i")
+_HEADER = struct.Struct("<4sii")
+_SIZE = struct.Struct("<iii")
+_TRANSFORM_IDS = struct.Struct("<iiii")
+_BYTE4 = struct.Struct("<BBBB")
+
+# MagicaVoxel's palette when no RGBA chunk is present, as 0xAABBGGRR values
+# fmt: off
+_DEFAULT_PALETTE_ABGR = [
+    0x00000000, 0xffffffff, 0xffccffff, 0xff99ffff, 0xff66ffff, 0xff33ffff,
+    0xff00ffff, 0xffffccff, 0xffccccff, 0xff99ccff, 0xff66ccff, 0xff33ccff,
+    0xff00ccff, 0xffff99ff, 0xffcc99ff, 0xff9999ff, 0xff6699ff, 0xff3399ff,
+    0xff0099ff, 0xffff66ff, 0xffcc66ff, 0xff9966ff, 0xff6666ff, 0xff3366ff,
+    0xff0066ff, 0xffff33ff, 0xffcc33ff, 0xff9933ff, 0xff6633ff, 0xff3333ff,
+    0xff0033ff, 0xffff00ff, 0xffcc00ff, 0xff9900ff, 0xff6600ff, 0xff3300ff,
+    0xff0000ff, 0xffffffcc, 0xffccffcc, 0xff99ffcc, 0xff66ffcc, 0xff33ffcc,
+    0xff00ffcc, 0xffffcccc, 0xffcccccc, 0xff99cccc, 0xff66cccc, 0xff33cccc,
+    0xff00cccc, 0xffff99cc, 0xffcc99cc, 0xff9999cc, 0xff6699cc, 0xff3399cc,
+    0xff0099cc, 0xffff66cc, 0xffcc66cc, 0xff9966cc, 0xff6666cc, 0xff3366cc,
+    0xff0066cc, 0xffff33cc, 0xffcc33cc, 0xff9933cc, 0xff6633cc, 0xff3333cc,
+    0xff0033cc, 0xffff00cc, 0xffcc00cc, 0xff9900cc, 0xff6600cc, 0xff3300cc,
+    0xff0000cc, 0xffffff99, 0xffccff99, 0xff99ff99, 0xff66ff99, 0xff33ff99,
+    0xff00ff99, 0xffffcc99, 0xffcccc99, 0xff99cc99, 0xff66cc99, 0xff33cc99,
+    0xff00cc99, 0xffff9999, 0xffcc9999, 0xff999999, 0xff669999, 0xff339999,
+    0xff009999, 0xffff6699, 0xffcc6699, 0xff996699, 0xff666699, 0xff336699,
+    0xff006699, 0xffff3399, 0xffcc3399, 0xff993399, 0xff663399, 0xff333399,
+    0xff003399, 0xffff0099, 0xffcc0099, 0xff990099, 0xff660099, 0xff330099,
+    0xff000099, 0xffffff66, 0xffccff66, 0xff99ff66, 0xff66ff66, 0xff33ff66,
+    0xff00ff66, 0xffffcc66, 0xffcccc66, 0xff99cc66, 0xff66cc66, 0xff33cc66,
+    0xff00cc66, 0xffff9966, 0xffcc9966, 0xff999966, 0xff669966, 0xff339966,
+    0xff009966, 0xffff6666, 0xffcc6666, 0xff996666, 0xff666666, 0xff336666,
+    0xff006666, 0xffff3366, 0xffcc3366, 0xff993366, 0xff663366, 0xff333366,
+    0xff003366, 0xffff0066, 0xffcc0066, 0xff990066, 0xff660066, 0xff330066,
+    0xff000066, 0xffffff33, 0xffccff33, 0xff99ff33, 0xff66ff33, 0xff33ff33,
+    0xff00ff33, 0xffffcc33, 0xffcccc33, 0xff99cc33, 0xff66cc33, 0xff33cc33,
+    0xff00cc33, 0xffff9933, 0xffcc9933, 0xff999933, 0xff669933, 0xff339933,
+    0xff009933, 0xffff6633, 0xffcc6633, 0xff996633, 0xff666633, 0xff336633,
+    0xff006633, 0xffff3333, 0xffcc3333, 0xff993333, 0xff663333, 0xff333333,
+    0xff003333, 0xffff0033, 0xffcc0033, 0xff990033, 0xff660033, 0xff330033,
+    0xff000033, 0xffffff00, 0xffccff00, 0xff99ff00, 0xff66ff00, 0xff33ff00,
+    0xff00ff00, 0xffffcc00, 0xffcccc00, 0xff99cc00, 0xff66cc00, 0xff33cc00,
+    0xff00cc00, 0xffff9900, 0xffcc9900, 0xff999900, 0xff669900, 0xff339900,
+    0xff009900, 0xffff6600, 0xffcc6600, 0xff996600, 0xff666600, 0xff336600,
+    0xff006600, 0xffff3300, 0xffcc3300, 0xff993300, 0xff663300, 0xff333300,
+    0xff003300, 0xffff0000, 0xffcc0000, 0xff990000, 0xff660000, 0xff330000,
+    0xff0000ee, 0xff0000dd, 0xff0000bb, 0xff0000aa, 0xff000088, 0xff000077,
+    0xff000055, 0xff000044, 0xff000022, 0xff000011, 0xff00ee00, 0xff00dd00,
+    0xff00bb00, 0xff00aa00, 0xff008800, 0xff007700, 0xff005500, 0xff004400,
+    0xff002200, 0xff001100, 0xffee0000, 0xffdd0000, 0xffbb0000, 0xffaa0000,
+    0xff880000, 0xff770000, 0xff550000, 0xff440000, 0xff220000, 0xff110000,
+    0xffeeeeee, 0xffdddddd, 0xffbbbbbb, 0xffaaaaaa, 0xff888888, 0xff777777,
+    0xff555555, 0xff444444, 0xff222222, 0xff111111,
+]
+# fmt: on
+DEFAULT_PALETTE = [tuple(abgr.to_bytes(4, "little")) for abgr in _DEFAULT_PALETTE_ABGR]
+
+
+class FileIter:
+    """Cursor over the bytes of a .vox file.
+
+    The bytes are accessed through a memoryview, so reads slice and unpack
+    them without copying. Use as a context manager to release the view, and
+    with it the underlying buffer, once parsing is done.
+    """
+
+    def __init__(self, bytes_: Union[bytes, mmap.mmap]):
+        """FileIter constructor."""
+        self.bytes_ = memoryview(bytes_)
+        self.index = 0
+        # shared instances of dictionary values seen so far in this file
+        self.strings: dict[str, str] = {}
+
+    def __enter__(self) -> "FileIter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.bytes_.release()
+
+    def at_end(self) -> bool:
+        """Check whether all bytes have been consumed."""
+        return self.index >= len(self.bytes_)
+
+    def peek_bytes(self, n: int) -> bytes:
+        """Read the next n bytes without advancing past them."""
+        return bytes(self.bytes_[self.index : self.index + n])
+
+    def read_bytes(self, n: int) -> memoryview:
+        """Read a view of the next n bytes and advance past them."""
+        if n < 0:
+            raise ValueError(f"Invalid length: {n}")
+        end = self.index + n
+        if end > len(self.bytes_):
+            raise ValueError("Unexpected end of .vox file.")
+        bytes_ = self.bytes_[self.index : end]
+        self.index = end
+        return bytes_
+
+    def unpack(self, struct_: struct.Struct) -> tuple:
+        """Unpack the given struct in place and advance past it."""
+        try:
+            values = struct_.unpack_from(self.bytes_, self.index)
+        except struct.error:
+            raise ValueError("Unexpected end of .vox file.") from None
+        self.index += struct_.size
+        return values
+
+    def read_int32(self) -> int:
+        """Read a 32-bit integer and advance past it."""
+        try:
+            (int32,) = _I32.unpack_from(self.bytes_, self.index)
+        except struct.error:
+            raise ValueError("Unexpected end of .vox file.") from None
+        self.index += 4
+        return int32
+
+    def read_string(self) -> str:
+        """Read a length-prefixed UTF-8 string and advance past it."""
+        try:
+            (length,) = _I32.unpack_from(self.bytes_, self.index)
+        except struct.error:
+            raise ValueError("Unexpected end of .vox file.") from None
+        if length < 0:
+            raise ValueError(f"Invalid string length: {length}")
+        start = self.index + 4
+        end = start + length
+        if end > len(self.bytes_):
+            raise ValueError("Unexpected end of .vox file.")
+        self.index = end
+        return str(self.bytes_[start:end], "utf-8")
+
+    def read_dict(self) -> dict:
+        """Read a dictionary of string keys and values and advance past it."""
+        length = self.read_int32()
+        if length < 0:
+            raise ValueError(f"Invalid dictionary length: {length}")
+
+        bytes_ = self.bytes_
+        unpack_from = _I32.unpack_from
+        intern = sys.intern
+        share = self.strings.setdefault
+        index = self.index
+        dict_ = {}
+        try:
+            for _ in range(length):
+                (key_length,) = unpack_from(bytes_, index)
+                index += 4
+                if key_length < 0:
+                    raise ValueError(f"Invalid string length: {key_length}")
+                key = intern(str(bytes_[index : index + key_length], "utf-8"))
+                index += key_length
+                (value_length,) = unpack_from(bytes_, index)
+                index += 4
+                if value_length < 0:
+                    raise ValueError(f"Invalid string length: {value_length}")
+                value = str(bytes_[index : index + value_length], "utf-8")
+                index += value_length
+                dict_[key] = share(value, value)
+        except struct.error:
+            raise ValueError("Unexpected end of .vox file.") from None
+        if index > len(bytes_):
+            raise ValueError("Unexpected end of .vox file.")
+
+        self.index = index
+        return dict_
 
 
 class Bytes:
     """Representative of .vox file bytes."""
 
     @staticmethod
-    def read(byte_iter: Iterator[int], n: int) -> bytes:
+    def read(file_iter: FileIter, n: int) -> bytes:
         """Read n bytes from bytes."""
-        return bytes([next(byte_iter) for _ in range(n)])
+        return bytes(file_iter.read_bytes(n))
 
 
 class Int32:
     """Representative of .vox file 32-bit integers."""
 
     @staticmethod
-    def read(byte_iter: Iterator[int]) -> int:
+    def read(file_iter: FileIter) -> int:
         """Read a 32-bit integer from bytes."""
-        return int.from_bytes(Bytes.read(byte_iter, 4), "little", signed=True)
+        return file_iter.read_int32()
 
     @staticmethod
     def write(int32: int) -> bytes:
         """Write a 32-bit integer to bytes."""
-        return int32.to_bytes(4, "little", signed=True)
+        return _I32.pack(int32)
 
 
 class String:
     """Representative of .vox file strings."""
 
     @staticmethod
-    def read(byte_iter: Iterator[int]) -> str:
+    def read(file_iter: FileIter) -> str:
         """Read a string from bytes."""
-        length = Int32.read(byte_iter)
-        return Bytes.read(byte_iter, length).decode("utf-8")
+        return file_iter.read_string()
 
     @staticmethod
     def write(string: str) -> bytes:
         """Write a string to bytes."""
-        return Int32.write(len(string)) + bytes(string, "utf-8")
+        bytes_ = string.encode("utf-8")
+        return Int32.write(len(bytes_)) + bytes_
 
 
 class Dict:
     """Representative of .vox file dictionaries."""
 
     @staticmethod
-    def read(byte_iter: Iterator[int]) -> dict:
+    def read(file_iter: FileIter) -> dict:
         """Read a dictionary from bytes."""
-        length = Int32.read(byte_iter)
-        dict_ = {}
-        for _ in range(length):
-            key = String.read(byte_iter)
-            value = String.read(byte_iter)
-            dict_[key] = value
-        return dict_
+        return file_iter.read_dict()
 
     @staticmethod
     def write(dict_: dict) -> bytes:
         """Write a dictionary to bytes."""
-        bytes_ = Int32.write(len(dict_))
+        pack = _I32.pack
+        parts = [pack(len(dict_))]
         for key, value in dict_.items():
-            bytes_ += String.write(key) + String.write(value)
-        return bytes_
+            key_bytes = key.encode("utf-8")
+            value_bytes = value.encode("utf-8")
+            parts += (
+                pack(len(key_bytes)),
+                key_bytes,
+                pack(len(value_bytes)),
+                value_bytes,
+            )
+        return b"".join(parts)
 
 
 class VoxFile:
@@ -83,24 +255,59 @@ class VoxFile:
     def read(path: str) -> "VoxFile":
         """Read a .vox file from the given path."""
         with open(path, "rb") as f:
-            byte_iter = iter(f.read())
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # pipes and empty files cannot be memory-mapped
+                return VoxFile._parse(f.read())
+
+            with mm:
+                return VoxFile._parse(mm)
 
-            header = Bytes.read(byte_iter, 4)
-            if header != b"VOX ":
+    @staticmethod
+    def _parse(bytes_) -> "VoxFile":
+        """Parse a .vox file from the given bytes-like object."""
+        with FileIter(bytes_) as file_iter:
+            if file_iter.peek_bytes(4) != b"VOX ":
                 raise ValueError("Invalid .vox file header.")
+            file_iter.read_bytes(4)
 
-            version = Int32.read(byte_iter)
+            version = file_iter.read_int32()
 
-            main = MainChunk.read(byte_iter)
+            main = MainChunk.read(file_iter)
 
             return VoxFile(version, main)
 
+    @staticmethod
+    def read_many(
+        paths: Iterable[str], workers: Optional[int] = None
+    ) -> list["VoxFile"]:
+        """Read several .vox files in parallel worker processes.
+
+        Parsing is pure Python and holds the GIL, so files are parsed in
+        separate processes rather than threads. With a single file or a single
+        CPU, the files are read serially to avoid the cost of pickling results.
+        """
+        paths = list(paths)
+        if len(paths) <= 1 or workers == 1 or os.cpu_count() == 1:
+            return [VoxFile.read(path) for path in paths]
+
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            return list(executor.map(VoxFile.read, paths))
+
     def write(self, path: str):
         """Write a .vox file to the given path."""
+        buf = bytearray(b"VOX ")
+        buf += Int32.write(self.version)
+        self.main.write(buf)
+
         with open(path, "wb") as f:
-            f.write(b"VOX ")
-            f.write(Int32.write(self.version))
-            f.write(bytes(self.main))
+            f.write(buf)
+
+
+# maps the ids of chunks that may appear in MAIN to their class and the
+# MainChunk field they are read into; filled in as chunk classes are defined
+_MAIN_CHILDREN: dict[bytes, tuple[type["Chunk"], str]] = {}
 
 
 class Chunk:
@@ -109,25 +316,47 @@ class Chunk:
     id = b""
     has_children = False
 
+    # the MainChunk field this chunk is read into, if it may appear in MAIN
+    main_field: Optional[str] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # every chunk type provides its own reader
+        if not hasattr(cls, "read"):
+            raise TypeError(f"Chunk class {cls.__name__} does not define read")
+        # only register classes that declare a field themselves, so that
+        # subclassing a chunk does not replace it in dispatch
+        if cls.__dict__.get("main_field") is not None:
+            _MAIN_CHILDREN[cls.id] = (cls, cls.main_field)
+
     @classmethod
-    def consume_header(cls, byte_iter: Iterator[int]):
-        """Consume and check the size of the chunk."""
-        Int32.read(byte_iter)  # consume chunk content size
-        child_bytes = Int32.read(byte_iter)  # consume child chunk size
-        if child_bytes and not cls.has_children:
+    def consume_header(cls, file_iter: FileIter) -> tuple[int, int]:
+        """Consume and check the header of the chunk.
+
+        Returns the sizes of the chunk content and of its children.
+        """
+        id, content_size, child_size = file_iter.unpack(_HEADER)
+        if id != cls.id:
+            raise ValueError(f"Invalid chunk ID: {id!r}; expected {cls.id!r}")
+        if child_size and not cls.has_children:
             raise ValueError(f"Chunk {cls.id!r} has unexpected children")
+        return content_size, child_size
+
+    def write(self, buf: bytearray):
+        """Append the chunk to the given buffer."""
+        buf += bytes(self)
 
     def to_chunk_byte_format(self, content: bytes, child_content: bytes) -> bytes:
         """Convert chunk to bytes"""
-        bytes_ = self.id
-
-        bytes_ += Int32.write(len(content))
-        bytes_ += Int32.write(len(child_content))
-
-        bytes_ += content
-        bytes_ += child_content
-
-        return bytes_
+        return b"".join(
+            (
+                self.id,
+                Int32.write(len(content)),
+                Int32.write(len(child_content)),
+                content,
+                child_content,
+            )
+        )
 
 
 class MainChunk(Chunk):
@@ -185,122 +414,95 @@ class MainChunk(Chunk):
         self.index_map = index_map
 
     @classmethod
-    def read(cls, byte_iter: Iterator[int]) -> "MainChunk":
-        """Read a main chunk from the given byte iterator."""
-        id = Bytes.read(byte_iter, 4)
-        if id != cls.id:
-            raise ValueError(f"Invalid chunk ID: {id!r}; expected {cls.id!r}")
-        cls.consume_header(byte_iter)
-
-        pack = None
-        models = []
-        palette = None
-        scene_graph: list[Union["TransformChunk", "GroupChunk", "ShapeChunk"]] = []
-        materials = []
-        layers = []
-        render_objects = []
-        render_cameras = []
-        palette_note = None
-        index_map = None
-
-        while True:
-            try:
-                id = Bytes.read(byte_iter, 4)
-            except StopIteration:
-                break
-
-            if id == PackChunk.id:
-                pack = PackChunk.read(byte_iter)
-            elif id == SizeChunk.id:
-                size_chunk = SizeChunk.read(byte_iter)
-
+    def read(cls, file_iter: FileIter) -> "MainChunk":
+        """Read a main chunk from the given file iterator."""
+        cls.consume_header(file_iter)
+
+        fields: dict = {
+            "pack": None,
+            "models": [],
+            "palette": None,
+            "scene_graph": [],
+            "materials": [],
+            "layers": [],
+            "render_objects": [],
+            "render_cameras": [],
+            "palette_note": None,
+            "index_map": None,
+        }
+
+        at_end = file_iter.at_end
+        peek_bytes = file_iter.peek_bytes
+        get_child = _MAIN_CHILDREN.get
+        while not at_end():
+            id = peek_bytes(4)
+
+            child = get_child(id)
+            if child is None:
+                # skip over chunks this module does not know about
+                _, content_size, child_size = file_iter.unpack(_HEADER)
+                if content_size < 0 or child_size < 0:
+                    raise ValueError(f"Invalid size for chunk {id!r}")
+                file_iter.read_bytes(content_size + child_size)
+                continue
+            child_cls, field = child
+
+            chunk = child_cls.read(file_iter)
+
+            if child_cls is SizeChunk:
                 # assume next chunk is XYZI chunk
-                id = Bytes.read(byte_iter, 4)
-                if id != XYZIChunk.id:
-                    raise ValueError(
-                        f"Invalid chunk ID: {id!r}; expected {XYZIChunk.id!r} following {SizeChunk.id!r}"
-                    )
-                xyzi_chunk = XYZIChunk.read(byte_iter)
-
-                models += [(size_chunk, xyzi_chunk)]
-            elif id == PaletteChunk.id:
-                palette = PaletteChunk.read(byte_iter)
-            elif id == TransformChunk.id:
-                transform_chunk = TransformChunk.read(byte_iter)
-                scene_graph += [transform_chunk]
-            elif id == GroupChunk.id:
-                group_chunk = GroupChunk.read(byte_iter)
-                scene_graph += [group_chunk]
-            elif id == ShapeChunk.id:
-                shape_chunk = ShapeChunk.read(byte_iter)
-                scene_graph += [shape_chunk]
-            elif id == MaterialChunk.id:
-                material_chunk = MaterialChunk.read(byte_iter)
-                materials += [material_chunk]
-            elif id == LayerChunk.id:
-                layer_chunk = LayerChunk.read(byte_iter)
-                layers += [layer_chunk]
-            elif id == RenderObjectChunk.id:
-                render_object = RenderObjectChunk.read(byte_iter)
-                render_objects += [render_object]
-            elif id == RenderCameraChunk.id:
-                render_camera = RenderCameraChunk.read(byte_iter)
-                render_cameras += [render_camera]
-            elif id == PaletteNoteChunk.id:
-                palette_note = PaletteNoteChunk.read(byte_iter)
-            elif id == IndexMapChunk.id:
-                index_map = IndexMapChunk.read(byte_iter)
+                xyzi_chunk = XYZIChunk.read(file_iter)
+
+                fields[field].append((chunk, xyzi_chunk))
+            elif isinstance(fields[field], list):
+                fields[field].append(chunk)
             else:
-                raise ValueError(f"Invalid chunk ID: {id!r}")
-
-        return MainChunk(
-            pack,
-            models,
-            palette,
-            scene_graph,
-            materials,
-            layers,
-            render_objects,
-            render_cameras,
-            palette_note,
-            index_map,
-        )
+                fields[field] = chunk
 
-    def __bytes__(self):
-        child_content = b""
+        return MainChunk(**fields)
 
+    def _children(self) -> Iterator[Chunk]:
+        """Yield the child chunks in the order they are written."""
         if self.pack is not None:
-            child_content += bytes(self.pack)
+            yield self.pack
 
-        for model in self.models:
-            child_content += bytes(model[0])
-            child_content += bytes(model[1])
-
-        for item in self.scene_graph:
-            child_content += bytes(item)
+        for size_chunk, xyzi_chunk in self.models:
+            yield size_chunk
+            yield xyzi_chunk
 
-        for layer in self.layers:
-            child_content += bytes(layer)
+        yield from self.scene_graph
+        yield from self.layers
 
         if self.palette is not None:
-            child_content += bytes(self.palette)
+            yield self.palette
 
         if self.index_map is not None:
-            child_content += bytes(self.index_map)
+            yield self.index_map
+
+        yield from self.materials
+        yield from self.render_objects
+        yield from self.render_cameras
 
-        for material in self.materials:
-            child_content += bytes(material)
+        if self.palette_note is not None:
+            yield self.palette_note
 
-        for render_object in self.render_objects:
-            child_content += bytes(render_object)
+    def write(self, buf: bytearray):
+        """Append the main chunk and all of its children to the given buffer."""
+        buf += self.id
+        buf += Int32.write(0)
+        child_size_index = len(buf)
+        buf += Int32.write(0)  # child content size, filled in below
+        child_start = len(buf)
 
-        for render_camera in self.render_cameras:
-            child_content += bytes(render_camera)
+        for child in self._children():
+            child.write(buf)
 
-        if self.palette_note is not None:
-            child_content += bytes(self.palette_note)
+        buf[child_size_index:child_start] = Int32.write(len(buf) - child_start)
 
-        return self.to_chunk_byte_format(b"", child_content)
+    def __bytes__(self):
+        buf = bytearray()
+        self.write(buf)
+        return bytes(buf)
 
 
 class PackChunk(Chunk):
@@ -314,20 +516,24 @@ class PackChunk(Chunk):
     """
 
     id = b"PACK"
+    main_field = "pack"
 
     def __init__(self, num_models: int):
         """PackChunk constructor."""
         self.num_models = num_models
 
     @classmethod
-    def read(cls, byte_iter: Iterator[int]) -> "PackChunk":
-        """Read a pack chunk from the given byte iterator."""
-        cls.consume_header(byte_iter)
+    def read(cls, file_iter: FileIter) -> "PackChunk":
+        """Read a pack chunk from the given file iterator."""
+        cls.consume_header(file_iter)
 
-        num_models = Int32.read(byte_iter)
+        num_models = file_iter.read_int32()
 
         return PackChunk(num_models)
 
+    def __bytes__(self):
+        return self.to_chunk_byte_format(Int32.write(self.num_models), b"")
+
 
 class SizeChunk(Chunk):
     """Size chunk class.
@@ -342,27 +548,22 @@ class SizeChunk(Chunk):
     """
 
     id = b"SIZE"
+    main_field = "models"
 
     def __init__(self, size: tuple[int, int, int]):
         """SizeChunk constructor."""
         self.size = size
 
     @classmethod
-    def read(cls, byte_iter: Iterator[int]) -> "SizeChunk":
-        cls.consume_header(byte_iter)
+    def read(cls, file_iter: FileIter) -> "SizeChunk":
+        cls.consume_header(file_iter)
 
-        x = Int32.read(byte_iter)
-        y = Int32.read(byte_iter)
-        z = Int32.read(byte_iter)
+        x, y, z = file_iter.unpack(_SIZE)
 
         return SizeChunk((x, y, z))
 
     def __bytes__(self):
-        content = (
-            Int32.write(self.size[0])
-            + Int32.write(self.size[1])
-            + Int32.write(self.size[2])
-        )
+        content = _SIZE.pack(*self.size)
 
         return self.to_chunk_byte_format(content, b"")
 
@@ -380,34 +581,82 @@ class XYZIChunk(Chunk):
 
     id = b"XYZI"
 
-    def __init__(self, voxels: list[tuple[int, int, int, int]]):
-        """XYZIChunk constructor."""
+    def __init__(
+        self, voxels: Union[bytes, bytearray, Iterable[tuple[int, int, int, int]]]
+    ):
+        """XYZIChunk constructor.
+
+        Voxels are stored packed as in the file, 4 bytes per voxel, and may be
+        given either in that form or as (x, y, z, colorIndex) tuples.
+        """
         self.voxels = voxels
 
-    @classmethod
-    def read(cls, byte_iter: Iterator[int]) -> "XYZIChunk":
-        cls.consume_header(byte_iter)
+    @property
+    def voxels(self) -> tuple[tuple[int, int, int, int], ...]:
+        """Voxels as a tuple of (x, y, z, colorIndex) tuples; assign to edit."""
+        if self._voxels is None:
+            self._voxels = tuple(_BYTE4.iter_unpack(self.voxel_bytes))
+        return self._voxels
+
+    @voxels.setter
+    def voxels(
+        self, voxels: Union[bytes, bytearray, Iterable[tuple[int, int, int, int]]]
+    ):
+        if isinstance(voxels, (bytes, bytearray)):
+            self.voxel_bytes = bytes(voxels)
+        else:
+            self.voxel_bytes = bytes(itertools.chain.from_iterable(voxels))
+        # unpacked lazily by the getter
+        self._voxels = None
+        if len(self.voxel_bytes) % _BYTE4.size:
+            raise ValueError("Voxel bytes must be a multiple of 4 bytes long.")
+
+    def __len__(self) -> int:
+        return len(self.voxel_bytes) // _BYTE4.size
+
+    def __iter__(self) -> Iterator[tuple[int, int, int, int]]:
+        return _BYTE4.iter_unpack(self.voxel_bytes)
+
+    @property
+    def xs(self) -> bytes:
+        """X coordinates of all voxels, one byte each."""
+        return self.voxel_bytes[0::4]
+
+    @property
+    def ys(self) -> bytes:
+        """Y coordinates of all voxels, one byte each."""
+        return self.voxel_bytes[1::4]
+
+    @property
+    def zs(self) -> bytes:
+        """Z coordinates of all voxels, one byte each."""
+        return self.voxel_bytes[2::4]
+
+    @property
+    def color_indices(self) -> bytes:
+        """Color indices of all voxels, one byte each."""
+        return self.voxel_bytes[3::4]
 
-        num_voxels = Int32.read(byte_iter)
+    @classmethod
+    def read(cls, file_iter: FileIter) -> "XYZIChunk":
+        cls.consume_header(file_iter)
 
-        voxels = []
-        for _ in range(num_voxels):
-            x = int.from_bytes(Bytes.read(byte_iter, 1), "little")
-            y = int.from_bytes(Bytes.read(byte_iter, 1), "little")
-            z = int.from_bytes(Bytes.read(byte_iter, 1), "little")
-            color_index = int.from_bytes(Bytes.read(byte_iter, 1), "little")
-            voxels += [(x, y, z, color_index)]
+        num_voxels = file_iter.read_int32()
 
-        return XYZIChunk(voxels)
+        voxel_bytes = bytes(file_iter.read_bytes(num_voxels * _BYTE4.size))
 
-    def __bytes__(self):
-        content = Int32.write(len(self.voxels))
+        return XYZIChunk(voxel_bytes)
 
-        for voxel in self.voxels:
-            for val in voxel:
-                content += val.to_bytes(1, "little")
+    def write(self, buf: bytearray):
+        """Append the chunk to the given buffer without copying the voxels."""
+        buf += _HEADER.pack(self.id, 4 + len(self.voxel_bytes), 0)
+        buf += Int32.write(len(self))
+        buf += self.voxel_bytes
 
-        return self.to_chunk_byte_format(content, b"")
+    def __bytes__(self):
+        buf = bytearray()
+        self.write(buf)
+        return bytes(buf)
 
 
 class PaletteChunk(Chunk):
@@ -427,38 +676,56 @@ class PaletteChunk(Chunk):
     """
 
     id = b"RGBA"
+    main_field = "palette"
 
-    def __init__(self, palette: list[tuple[int, int, int, int]]):
-        """PaletteChunk constructor."""
-        self.palette = palette
+    def __init__(
+        self, palette: Union[bytes, bytearray, Sequence[tuple[int, int, int, int]]]
+    ):
+        """PaletteChunk constructor.
 
-    @classmethod
-    def read(cls, byte_iter: Iterator[int]) -> "PaletteChunk":
-        cls.consume_header(byte_iter)
+        Colors for palette indices [1-255] are stored packed as in the file, and
+        may be given either in that form or as a sequence of 256 (R, G, B, A)
+        tuples indexed by palette index, in which case entry 0 is ignored.
+        """
+        self.palette = palette
 
-        palette = [(0, 0, 0, 0)]
-        for _ in range(255):
-            r = int.from_bytes(Bytes.read(byte_iter, 1), "little")
-            g = int.from_bytes(Bytes.read(byte_iter, 1), "little")
-            b = int.from_bytes(Bytes.read(byte_iter, 1), "little")
-            a = int.from_bytes(Bytes.read(byte_iter, 1), "little")
-            palette += [(r, g, b, a)]
+    @property
+    def palette(self) -> tuple[tuple[int, int, int, int], ...]:
+        """Colors as (R, G, B, A) tuples indexed by palette index; assign to edit."""
+        return ((0, 0, 0, 0),) + tuple(_BYTE4.iter_unpack(self.color_bytes))
 
-        # for some reason, this still uses 256 bytes, so discard another 4 bytes afterwards
-        Bytes.read(byte_iter, 4)
+    @palette.setter
+    def palette(
+        self, palette: Union[bytes, bytearray, Sequence[tuple[int, int, int, int]]]
+    ):
+        if isinstance(palette, (bytes, bytearray)):
+            self.color_bytes = bytes(palette)
+        else:
+            self.color_bytes = bytes(itertools.chain.from_iterable(palette[1:]))
+        if len(self.color_bytes) != 255 * _BYTE4.size:
+            raise ValueError("Palette must contain exactly 255 colors.")
 
-        return PaletteChunk(palette)
+    @classmethod
+    def read(cls, file_iter: FileIter) -> "PaletteChunk":
+        cls.consume_header(file_iter)
 
-    def __bytes__(self):
-        content = b""
+        # for some reason, this still uses 256 colors, so discard the last 4 bytes
+        color_bytes = bytes(
+            file_iter.read_bytes(256 * _BYTE4.size)[: 255 * _BYTE4.size]
+        )
 
-        for color in self.palette[1:]:
-            for val in color:
-                content += val.to_bytes(1, "little")
+        return PaletteChunk(color_bytes)
 
-        content += (0).to_bytes(4, "little")
+    def write(self, buf: bytearray):
+        """Append the chunk to the given buffer without copying the colors."""
+        buf += _HEADER.pack(self.id, 1024, 0)
+        buf += self.color_bytes
+        buf += bytes(4)
 
-        return self.to_chunk_byte_format(content, b"")
+    def __bytes__(self):
+        buf = bytearray()
+        self.write(buf)
+        return bytes(buf)
 
 
 class TransformChunk(Chunk):
@@ -483,6 +750,7 @@ class TransformChunk(Chunk):
     """
 
     id = b"nTRN"
+    main_field = "scene_graph"
 
     def __init__(
         self,
@@ -500,37 +768,35 @@ class TransformChunk(Chunk):
         self.frames = frames
 
     @classmethod
-    def read(cls, byte_iter: Iterator[int]) -> "TransformChunk":
-        cls.consume_header(byte_iter)
+    def read(cls, file_iter: FileIter) -> "TransformChunk":
+        cls.consume_header(file_iter)
 
-        node_id = Int32.read(byte_iter)
-        attributes = Dict.read(byte_iter)
-        child_node_id = Int32.read(byte_iter)
-        reserved_id = Int32.read(byte_iter)
+        node_id = file_iter.read_int32()
+        attributes = file_iter.read_dict()
+        child_node_id, reserved_id, layer_id, num_frames = file_iter.unpack(
+            _TRANSFORM_IDS
+        )
         if reserved_id != -1:
             raise ValueError(f"Invalid reserved id: {reserved_id}")
-        layer_id = Int32.read(byte_iter)
-        num_frames = Int32.read(byte_iter)
 
-        frames = []
-        for _ in range(num_frames):
-            frame_attributes = Dict.read(byte_iter)
-            frames += [frame_attributes]
+        read_dict = file_iter.read_dict
+        frames = [read_dict() for _ in range(num_frames)]
 
         return TransformChunk(node_id, attributes, child_node_id, layer_id, frames)
 
     def __bytes__(self):
-        content = Int32.write(self.node_id)
-        content += Dict.write(self.attributes)
-        content += Int32.write(self.child_node_id)
-        content += Int32.write(-1)
-        content += Int32.write(self.layer_id)
-        content += Int32.write(len(self.frames))
+        parts = [
+            Int32.write(self.node_id),
+            Dict.write(self.attributes),
+            _TRANSFORM_IDS.pack(
+                self.child_node_id, -1, self.layer_id, len(self.frames)
+            ),
+        ]
 
         for frame in self.frames:
-            content += Dict.write(frame)
+            parts.append(Dict.write(frame))
 
-        return self.to_chunk_byte_format(content, b"")
+        return self.to_chunk_byte_format(b"".join(parts), b"")
 
 
 class GroupChunk(Chunk):
@@ -547,6 +813,7 @@ class GroupChunk(Chunk):
     """
 
     id = b"nGRP"
+    main_field = "scene_graph"
 
     def __init__(
         self,
@@ -560,31 +827,35 @@ class GroupChunk(Chunk):
         self.child_node_ids = child_node_ids
 
     @classmethod
-    def read(cls, byte_iter: Iterator[int]) -> "GroupChunk":
-        cls.consume_header(byte_iter)
-
-        node_id = Int32.read(byte_iter)
-        attributes = Dict.read(byte_iter)
-        num_children = Int32.read(byte_iter)
-
-        child_node_ids = []
-        for _ in range(num_children):
-            child_node_id = Int32.read(byte_iter)
-            child_node_ids += [child_node_id]
+    def read(cls, file_iter: FileIter) -> "GroupChunk":
+        cls.consume_header(file_iter)
+
+        node_id = file_iter.read_int32()
+        attributes = file_iter.read_dict()
+        num_children = file_iter.read_int32()
+
+        if num_children < 0:
+            raise ValueError(f"Invalid number of children: {num_children}")
+
+        # unpack all child ids from one slice
+        child_node_ids = [
+            child_node_id
+            for (child_node_id,) in _I32.iter_unpack(
+                file_iter.read_bytes(4 * num_children)
+            )
+        ]
 
         return GroupChunk(node_id, attributes, child_node_ids)
 
     def __bytes__(self):
-        content = Int32.write(self.node_id)
-
-        content += Dict.write(self.attributes)
-
-        content += Int32.write(len(self.child_node_ids))
-
-        for child_node_id in self.child_node_ids:
-            content += Int32.write(child_node_id)
+        parts = [
+            Int32.write(self.node_id),
+            Dict.write(self.attributes),
+            Int32.write(len(self.child_node_ids)),
+            b"".join(map(_I32.pack, self.child_node_ids)),
+        ]
 
-        return self.to_chunk_byte_format(content, b"")
+        return self.to_chunk_byte_format(b"".join(parts), b"")
 
 
 class ShapeChunk(Chunk):
@@ -603,6 +874,7 @@ class ShapeChunk(Chunk):
     """
 
     id = b"nSHP"
+    main_field = "scene_graph"
 
     def __init__(self, node_id: int, attributes: dict, models: list[tuple[int, dict]]):
         """ShapeChunk constructor."""
@@ -611,33 +883,31 @@ class ShapeChunk(Chunk):
         self.models = models
 
     @classmethod
-    def read(cls, byte_iter: Iterator[int]) -> "ShapeChunk":
-        cls.consume_header(byte_iter)
+    def read(cls, file_iter: FileIter) -> "ShapeChunk":
+        cls.consume_header(file_iter)
 
-        node_id = Int32.read(byte_iter)
-        attributes = Dict.read(byte_iter)
-        num_models = Int32.read(byte_iter)
+        node_id = file_iter.read_int32()
+        attributes = file_iter.read_dict()
+        num_models = file_iter.read_int32()
 
-        models = []
-        for _ in range(num_models):
-            model_id = Int32.read(byte_iter)
-            model_attributes = Dict.read(byte_iter)
-            models += [(model_id, model_attributes)]
+        read_int32 = file_iter.read_int32
+        read_dict = file_iter.read_dict
+        models = [(read_int32(), read_dict()) for _ in range(num_models)]
 
         return ShapeChunk(node_id, attributes, models)
 
     def __bytes__(self):
-        content = Int32.write(self.node_id)
-
-        content += Dict.write(self.attributes)
-
-        content += Int32.write(len(self.models))
+        parts = [
+            Int32.write(self.node_id),
+            Dict.write(self.attributes),
+            Int32.write(len(self.models)),
+        ]
 
         for model in self.models:
-            content += Int32.write(model[0])
-            content += Dict.write(model[1])
+            parts.append(Int32.write(model[0]))
+            parts.append(Dict.write(model[1]))
 
-        return self.to_chunk_byte_format(content, b"")
+        return self.to_chunk_byte_format(b"".join(parts), b"")
 
 
 class MaterialChunk(Chunk):
@@ -656,25 +926,24 @@ class MaterialChunk(Chunk):
     """
 
     id = b"MATL"
+    main_field = "materials"
 
     def __init__(self, material_id: int, properties: dict):
         self.material_id = material_id
         self.properties = properties
 
     @classmethod
-    def read(cls, byte_iter: Iterator[int]):
-        cls.consume_header(byte_iter)
+    def read(cls, file_iter: FileIter):
+        cls.consume_header(file_iter)
 
-        material_id = Int32.read(byte_iter)
+        material_id = file_iter.read_int32()
 
-        properties = Dict.read(byte_iter)
+        properties = file_iter.read_dict()
 
         return MaterialChunk(material_id, properties)
 
     def __bytes__(self):
-        content = Int32.write(self.material_id)
-
-        content += Dict.write(self.properties)
+        content = Int32.write(self.material_id) + Dict.write(self.properties)
 
         return self.to_chunk_byte_format(content, b"")
 
@@ -690,31 +959,30 @@ class LayerChunk(Chunk):
     """
 
     id = b"LAYR"
+    main_field = "layers"
 
     def __init__(self, layer_id: int, attribute: dict):
         self.layer_id = layer_id
         self.attribute = attribute
 
     @classmethod
-    def read(cls, byte_iter: Iterator[int]):
-        cls.consume_header(byte_iter)
+    def read(cls, file_iter: FileIter):
+        cls.consume_header(file_iter)
 
-        layer_id = Int32.read(byte_iter)
+        layer_id = file_iter.read_int32()
 
-        attribute = Dict.read(byte_iter)
+        attribute = file_iter.read_dict()
 
-        reserved_id = Int32.read(byte_iter)
+        reserved_id = file_iter.read_int32()
         if reserved_id != -1:
             raise ValueError(f"Invalid reserved id: {reserved_id}")
 
         return LayerChunk(layer_id, attribute)
 
     def __bytes__(self):
-        content = Int32.write(self.layer_id)
-
-        content += Dict.write(self.attribute)
-
-        content += Int32.write(-1)
+        content = b"".join(
+            (Int32.write(self.layer_id), Dict.write(self.attribute), Int32.write(-1))
+        )
 
         return self.to_chunk_byte_format(content, b"")
 
@@ -726,15 +994,16 @@ class RenderObjectChunk(Chunk):
     """
 
     id = b"rOBJ"
+    main_field = "render_objects"
 
     def __init__(self, attributes: dict):
         self.attributes = attributes
 
     @classmethod
-    def read(cls, byte_iter: Iterator[int]):
-        cls.consume_header(byte_iter)
+    def read(cls, file_iter: FileIter):
+        cls.consume_header(file_iter)
 
-        attributes = Dict.read(byte_iter)
+        attributes = file_iter.read_dict()
 
         return RenderObjectChunk(attributes)
 
@@ -758,25 +1027,24 @@ class RenderCameraChunk(Chunk):
     """
 
     id = b"rCAM"
+    main_field = "render_cameras"
 
     def __init__(self, camera_id: int, attribute: dict):
         self.camera_id = camera_id
         self.attribute = attribute
 
     @classmethod
-    def read(cls, byte_iter: Iterator[int]):
-        cls.consume_header(byte_iter)
+    def read(cls, file_iter: FileIter):
+        cls.consume_header(file_iter)
 
-        camera_id = Int32.read(byte_iter)
+        camera_id = file_iter.read_int32()
 
-        attribute = Dict.read(byte_iter)
+        attribute = file_iter.read_dict()
 
         return RenderCameraChunk(camera_id, attribute)
 
     def __bytes__(self):
-        content = Int32.write(self.camera_id)
-
-        content += Dict.write(self.attribute)
+        content = Int32.write(self.camera_id) + Dict.write(self.attribute)
 
         return self.to_chunk_byte_format(content, b"")
 
@@ -793,30 +1061,29 @@ class PaletteNoteChunk(Chunk):
     """
 
     id = b"NOTE"
+    main_field = "palette_note"
 
     def __init__(self, color_names: list[str]):
         self.color_names = color_names
 
     @classmethod
-    def read(cls, byte_iter: Iterator[int]):
-        cls.consume_header(byte_iter)
-
-        color_names = []
+    def read(cls, file_iter: FileIter):
+        cls.consume_header(file_iter)
 
-        num_color_names = Int32.read(byte_iter)
+        num_color_names = file_iter.read_int32()
 
-        for _ in range(num_color_names):
-            color_names.append(String.read(byte_iter))
+        read_string = file_iter.read_string
+        color_names = [read_string() for _ in range(num_color_names)]
 
         return PaletteNoteChunk(color_names)
 
     def __bytes__(self):
-        content = Int32.write(len(self.color_names))
+        parts = [Int32.write(len(self.color_names))]
 
         for color_name in self.color_names:
-            content += String.read(color_name)
+            parts.append(String.write(color_name))
 
-        return self.to_chunk_byte_format(content, b"")
+        return self.to_chunk_byte_format(b"".join(parts), b"")
 
 
 class IndexMapChunk(Chunk):
@@ -833,24 +1100,32 @@ class IndexMapChunk(Chunk):
     """
 
     id = b"IMAP"
+    main_field = "index_map"
+
+    def __init__(self, palette_indices: Union[bytes, bytearray, Iterable[int]]):
+        """IndexMapChunk constructor.
 
-    def __init__(self, palette_indices: list[int]):
+        The 256 palette index associations are stored packed, one byte each,
+        and are only expanded when palette_indices is accessed.
+        """
         self.palette_indices = palette_indices
 
-    @classmethod
-    def read(cls, byte_iter: Iterator[int]):
-        cls.consume_header(byte_iter)
+    @property
+    def palette_indices(self) -> tuple[int, ...]:
+        """Palette index associations as a tuple of ints; assign to edit."""
+        return tuple(self.index_bytes)
 
-        palette_indices = [
-            int.from_bytes(Bytes.read(byte_iter, 1), "little") for _ in range(256)
-        ]
+    @palette_indices.setter
+    def palette_indices(self, palette_indices: Union[bytes, bytearray, Iterable[int]]):
+        self.index_bytes = bytes(palette_indices)
 
-        return IndexMapChunk(palette_indices)
+    @classmethod
+    def read(cls, file_iter: FileIter):
+        cls.consume_header(file_iter)
 
-    def __bytes__(self):
-        content = b""
+        index_bytes = bytes(file_iter.read_bytes(256))
 
-        for palette_index in self.palette_indices:
-            content += palette_index.to_bytes(1, "little")
+        return IndexMapChunk(index_bytes)
 
-        return self.to_chunk_byte_format(content, b"")
+    def __bytes__(self):
+        return self.to_chunk_byte_format(self.index_bytes, b"")